@@ -23,17 +23,23 @@ Verwendung:
 """
 
 import argparse
+import io
 import json
+import operator
 import os
+import shutil
+import sys
 import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Flask für REST API
 try:
-    from flask import Flask, request, jsonify, send_file, make_response
+    from flask import Flask, Response, request, jsonify, send_file, stream_with_context
     from flask_cors import CORS
 except ImportError:
     print("Flask nicht installiert. Installiere mit:")
@@ -61,12 +67,61 @@ except ImportError:
     PDF_SUPPORT = False
     print("⚠️ pdfplumber nicht installiert - PDF-Extraktion deaktiviert")
 
+# Optional: PyMuPDF für schnelle reine Textextraktion (MuPDF C-Engine,
+# um Größenordnungen schneller als pdfminers Layout-Analyse)
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_SUPPORT = True
+except ImportError:
+    PYMUPDF_SUPPORT = False
+
+# Optional: Response-Kompression (Extraktions-JSON ist hochgradig
+# komprimierbar - wiederholte Feldnamen, ähnliche Werte)
+try:
+    from flask_compress import Compress
+    COMPRESS_SUPPORT = True
+except ImportError:
+    COMPRESS_SUPPORT = False
+
+# Optional: orjson als JSON-Encoder (C-Implementierung, 3-10x schneller als
+# Flasks Standard-Encoder; serialisiert NumPy-Skalare aus pandas direkt)
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, default=str, option=self._OPTIONS).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
 # ============================================================================
 # FLASK APP MIT KORRIGIERTER CORS-KONFIGURATION
 # ============================================================================
 
 app = Flask(__name__)
 
+# Schneller JSON-Encoder für die großen Extraktions-Responses
+if ORJSON_SUPPORT:
+    app.json = OrjsonProvider(app)
+
+# gzip/brotli-Kompression: Extraktions-Responses schrumpfen auf ~10%,
+# Level 4 hält die CPU-Kosten pro Request klein
+if COMPRESS_SUPPORT:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
 # ERWEITERTE CORS-KONFIGURATION für Base44
 CORS(app, resources={
     r"/api/*": {
@@ -79,66 +134,143 @@ CORS(app, resources={
     }
 })
 
+# Upload-Limit: schützt den Server vor übergroßen Uploads (Werkzeug bricht
+# den Request mit 413 ab, bevor der Body komplett gelesen wird)
+app.config['MAX_CONTENT_LENGTH'] = 200 * 1024 * 1024  # 200 MB
+
+# Upload-Staging auf tmpfs: der save→read→delete-Zyklus der Extract-Endpoints
+# läuft dann komplett im RAM statt auf Platte. MAX_CONTENT_LENGTH (oben)
+# verhindert, dass ein einzelner Upload /dev/shm vollschreibt.
+if sys.platform == 'linux' and os.path.isdir('/dev/shm'):
+    tempfile.tempdir = '/dev/shm'
+
 # Global instances
 excel_reader = RentRollExcelReader()
 validator = DataValidator()
+number_parser = NumberUnitParser()
 
-# ============================================================================
-# CORS PREFLIGHT HANDLER
-# ============================================================================
+@lru_cache(maxsize=131072)
+def _parse_number_cached(value, context: Optional[str]):
+    """
+    Memoized parse für /api/parse/number.
 
-@app.after_request
-def after_request(response):
-    """Füge CORS-Header zu jeder Response hinzu."""
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,POST,OPTIONS')
-    response.headers.add('Access-Control-Max-Age', '3600')
-    return response
-
-@app.route('/api/<path:path>', methods=['OPTIONS'])
-def handle_options(path):
-    """Handle CORS preflight requests."""
-    response = make_response()
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,POST,OPTIONS')
-    response.headers.add('Access-Control-Max-Age', '3600')
-    return response
+    Identische (value, context)-Paare kommen in Batches häufig wiederholt
+    vor; parse() ist eine reine Funktion, das Ergebnis kann also geteilt
+    werden. Die Response wird pro Request als frisches Dict aufgebaut,
+    gecachte NumberWithUnit-Objekte werden nie mutiert.
+    """
+    return number_parser.parse(value, context)
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def allowed_file(filename: str, allowed_extensions: set) -> bool:
+# Erlaubte Datei-Endungen - einmalig als frozenset, statt pro Request
+# neu aufgebaute set-Literale in den Endpoints
+_EXCEL_EXTS = frozenset({'xlsx', 'xls', 'xlsm', 'xlsb'})
+_PDF_EXTS = frozenset({'pdf'})
+
+# Workbooks bis zu dieser Größe werden komplett im Speicher geparst und
+# sparen sich den Temp-Datei-Umweg (2x schreiben + 1x lesen auf Platte)
+_IN_MEMORY_EXCEL_LIMIT = 8 * 1024 * 1024  # 8 MiB
+
+def allowed_file(filename: str, allowed_extensions: frozenset) -> bool:
     """Check if file has allowed extension."""
-    if not filename:
-        return False
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in allowed_extensions
+    return bool(filename) and '.' in filename and \
+           filename.rpartition('.')[2].lower() in allowed_extensions
 
-def extract_pdf_text(filepath: Path) -> str:
-    """Extract text from PDF using pdfplumber."""
-    if not PDF_SUPPORT:
-        raise RuntimeError("PDF support not available - install pdfplumber")
-    
+def save_upload_to_temp(file, suffix: str) -> Path:
+    """
+    Stream an uploaded file to a named temp file in 1 MiB chunks.
+
+    file.save() würde den kompletten Upload erst im Speicher puffern und dann
+    ein zweites Mal kopieren. Hier wird der Stream chunked direkt auf Platte
+    geschrieben; hat Werkzeug den Upload bereits in eine passende Temp-Datei
+    gespoolt, wird diese ohne Kopie wiederverwendet.
+    """
+    stream = file.stream
+    stream_name = getattr(stream, 'name', None)
+    if isinstance(stream_name, str) and stream_name.endswith(suffix) \
+            and os.path.exists(stream_name):
+        # Parser hat bereits auf Platte gestreamt - keine zweite Kopie nötig
+        return Path(stream_name)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(stream, tmp, length=1024 * 1024)
+        return Path(tmp.name)
+
+def process_pdf_page(page, include_tables: bool = True) -> Tuple[str, int]:
+    """
+    Extract text and tables from a single pdfplumber page.
+
+    Thread-Worker für extract_pdf: Seiten sind unabhängig und pdfminer gibt
+    beim Parsen den GIL oft genug frei, dass Threads auf Multi-Core-Maschinen
+    echten Durchsatz bringen.
+    """
     text_parts = []
-    with pdfplumber.open(filepath) as pdf:
-        for page in pdf.pages:
-            # Text extrahieren
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-            
-            # Tabellen extrahieren
-            tables = page.extract_tables()
-            for table in tables:
-                if table:
-                    for row in table:
-                        if row:
-                            text_parts.append('\t'.join(str(cell or '') for cell in row))
-    
-    return '\n'.join(text_parts)
+    tables_found = 0
+
+    # Text extrahieren
+    text = page.extract_text()
+    if text:
+        text_parts.append(text)
+
+    # Tabellen extrahieren
+    if include_tables:
+        for table in page.extract_tables():
+            if table:
+                tables_found += 1
+                for row in table:
+                    if row:
+                        text_parts.append('\t'.join(str(cell or '') for cell in row))
+
+    return '\n'.join(text_parts), tables_found
+
+def count_pdf_tables(page) -> int:
+    """
+    Count detected tables on a single pdfplumber page (thread worker).
+
+    find_tables() führt nur die Linien-/Kantenerkennung aus; extract_tables()
+    würde zusätzlich jede einzelne Zelle extrahieren - für reines Zählen
+    ist das die teuerste Operation von pdfplumber umsonst.
+    """
+    return len(page.find_tables())
+
+# Validation-Error-Formatierung: ein attrgetter-Aufruf pro Error statt
+# fünf einzelner Attribut-Lookups (die Schleife skaliert mit der Zeilenzahl)
+_VE_KEYS = ('severity', 'row_index', 'field', 'message', 'value')
+_VE_GET = operator.attrgetter(*_VE_KEYS)
+
+# Ab dieser Zeilenzahl wird die Extraktions-Response gestreamt statt
+# komplett im Speicher serialisiert
+_STREAM_ROW_THRESHOLD = 1000
+
+def _json_bytes(obj) -> bytes:
+    """Serialize one object to JSON bytes (orjson wenn verfügbar)."""
+    if ORJSON_SUPPORT:
+        return orjson.dumps(obj, default=str, option=OrjsonProvider._OPTIONS)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+def iter_extract_json(response: Dict[str, Any]):
+    """
+    Yield an extract response as JSON chunks, record by record.
+
+    jsonify würde für zehntausende Zeilen erst den kompletten JSON-String
+    im Speicher aufbauen. Hier bekommt der Client bereits Bytes, während
+    die restlichen Records noch serialisiert werden; der Gesamtstring
+    materialisiert nie.
+    """
+    data = response['data']
+    yield b'{"data":['
+    for i, row in enumerate(data):
+        if i:
+            yield b','
+        yield _json_bytes(row)
+    yield b']'
+    for key, value in response.items():
+        if key != 'data':
+            yield b',"' + key.encode('utf-8') + b'":' + _json_bytes(value)
+    yield b'}'
 
 def format_response(result: ExtractionResult) -> Dict[str, Any]:
     """Format ExtractionResult for JSON response."""
@@ -156,6 +288,77 @@ def format_response(result: ExtractionResult) -> Dict[str, Any]:
         'validation_errors': []
     }
 
+# ============================================================================
+# STATIC RESPONSES - einmal beim Import serialisiert
+# ============================================================================
+# Diese Payloads sind vollständig statisch; jsonify würde sie auf jedem
+# Request neu aufbauen und encodieren. Vorberechnete Bytes reduzieren die
+# Endpoints auf ein reines send().
+
+_ROOT_PAYLOAD = {
+    'message': 'Rent Roll Extraction API Server',
+    'version': '2.1.0',
+    'endpoints': {
+        'health': '/api/health',
+        'schema': '/api/schema',
+        'extract_excel': '/api/extract/excel (POST)',
+        'extract_pdf': '/api/extract/pdf (POST)',
+        'validate': '/api/validate (POST)'
+    }
+}
+
+_HEALTH_CAPABILITIES = {
+    'excel': True,
+    'pdf': PDF_SUPPORT,
+    'multi_sheet': True,
+    'unit_separation': True,
+    'locale_aware': True
+}
+
+_SCHEMA_PAYLOAD = {
+    'core_fields': {
+        'unit_id': 'Eindeutige Einheits-ID',
+        'tenant_name': 'Name des Mieters',
+        'tenant_id': 'Numerische Mieter-ID (falls vorhanden)',
+        'contractual_partner': 'Vertragspartner (Fallback für Mieter)',
+        'contract_id': 'Vertragsnummer',
+        'asset_id': 'SAP-Objektnummer / Asset-ID'
+    },
+    'area_fields': {
+        'area_sqm_value': 'Fläche in m² (Zahlenwert)',
+        'area_sqm_unit': 'Flächen-Einheit (m²)',
+        'area_sqft_value': 'Fläche in sqft (Zahlenwert)',
+        'area_sqft_unit': 'Flächen-Einheit (sqft)'
+    },
+    'rent_fields': {
+        'monthly_rent_value': 'Monatliche Miete (Zahlenwert)',
+        'monthly_rent_unit': 'Währung (EUR, USD, etc.)',
+        'annual_rent_value': 'Jahresmiete (Zahlenwert)',
+        'annual_rent_unit': 'Währung'
+    },
+    'date_fields': {
+        'lease_start': 'Mietbeginn',
+        'lease_end': 'Mietende',
+        'break_date': 'Kündigungsoption'
+    },
+    'status_fields': {
+        'status': 'Belegungsstatus (Vermietet, Leer, etc.)',
+        'usage_type': 'Nutzungsart (Büro, Retail, etc.)',
+        'lease_type': 'Vertragsart'
+    },
+    'meta_fields': {
+        '_source_file': 'Quelldatei',
+        '_source_sheet': 'Quell-Sheet',
+        '_source_row': 'Quell-Zeile (1-indexed)',
+        '_extraction_timestamp': 'Extraktionszeitpunkt'
+    },
+    'format_note': 'Felder mit Units werden in 3 Teile gesplittet: _value, _unit, _original'
+}
+
+_ROOT_BYTES = json.dumps(_ROOT_PAYLOAD).encode('utf-8')
+_SCHEMA_BYTES = json.dumps(_SCHEMA_PAYLOAD, ensure_ascii=False).encode('utf-8')
+_STATIC_CACHE_HEADERS = {'Cache-Control': 'public, max-age=3600'}
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
@@ -163,17 +366,8 @@ def format_response(result: ExtractionResult) -> Dict[str, Any]:
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint - redirect to health."""
-    return jsonify({
-        'message': 'Rent Roll Extraction API Server',
-        'version': '2.1.0',
-        'endpoints': {
-            'health': '/api/health',
-            'schema': '/api/schema',
-            'extract_excel': '/api/extract/excel (POST)',
-            'extract_pdf': '/api/extract/pdf (POST)',
-            'validate': '/api/validate (POST)'
-        }
-    })
+    return Response(_ROOT_BYTES, mimetype='application/json',
+                    headers=_STATIC_CACHE_HEADERS)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -182,60 +376,16 @@ def health_check():
         'status': 'healthy',
         'version': '2.1.0',
         'timestamp': datetime.now().isoformat(),
-        'capabilities': {
-            'excel': True,
-            'pdf': PDF_SUPPORT,
-            'multi_sheet': True,
-            'unit_separation': True,
-            'locale_aware': True
-        }
+        'capabilities': _HEALTH_CAPABILITIES
     })
 
 @app.route('/api/schema', methods=['GET'])
 def get_schema():
     """Return available canonical fields and their descriptions."""
-    schema = {
-        'core_fields': {
-            'unit_id': 'Eindeutige Einheits-ID',
-            'tenant_name': 'Name des Mieters',
-            'tenant_id': 'Numerische Mieter-ID (falls vorhanden)',
-            'contractual_partner': 'Vertragspartner (Fallback für Mieter)',
-            'contract_id': 'Vertragsnummer',
-            'asset_id': 'SAP-Objektnummer / Asset-ID'
-        },
-        'area_fields': {
-            'area_sqm_value': 'Fläche in m² (Zahlenwert)',
-            'area_sqm_unit': 'Flächen-Einheit (m²)',
-            'area_sqft_value': 'Fläche in sqft (Zahlenwert)',
-            'area_sqft_unit': 'Flächen-Einheit (sqft)'
-        },
-        'rent_fields': {
-            'monthly_rent_value': 'Monatliche Miete (Zahlenwert)',
-            'monthly_rent_unit': 'Währung (EUR, USD, etc.)',
-            'annual_rent_value': 'Jahresmiete (Zahlenwert)',
-            'annual_rent_unit': 'Währung'
-        },
-        'date_fields': {
-            'lease_start': 'Mietbeginn',
-            'lease_end': 'Mietende',
-            'break_date': 'Kündigungsoption'
-        },
-        'status_fields': {
-            'status': 'Belegungsstatus (Vermietet, Leer, etc.)',
-            'usage_type': 'Nutzungsart (Büro, Retail, etc.)',
-            'lease_type': 'Vertragsart'
-        },
-        'meta_fields': {
-            '_source_file': 'Quelldatei',
-            '_source_sheet': 'Quell-Sheet',
-            '_source_row': 'Quell-Zeile (1-indexed)',
-            '_extraction_timestamp': 'Extraktionszeitpunkt'
-        },
-        'format_note': 'Felder mit Units werden in 3 Teile gesplittet: _value, _unit, _original'
-    }
-    return jsonify(schema)
+    return Response(_SCHEMA_BYTES, mimetype='application/json',
+                    headers=_STATIC_CACHE_HEADERS)
 
-@app.route('/api/extract/excel', methods=['POST', 'OPTIONS'])
+@app.route('/api/extract/excel', methods=['POST'])
 def extract_excel():
     """
     Extract rent roll data from Excel file.
@@ -249,9 +399,6 @@ def extract_excel():
         - process_all_sheets: bool (default: true)
         - validate: bool (default: true)
     """
-    if request.method == 'OPTIONS':
-        return handle_options('extract/excel')
-    
     # Check file
     if 'file' not in request.files:
         return jsonify({
@@ -266,13 +413,11 @@ def extract_excel():
     
     # KORRIGIERT: Erweiterte Dateiformat-Prüfung
     filename = file.filename.lower()
-    allowed_extensions = {'xlsx', 'xls', 'xlsm', 'xlsb'}
-    
-    if not allowed_file(filename, allowed_extensions):
+    if not allowed_file(filename, _EXCEL_EXTS):
         return jsonify({
             'success': False, 
             'error': f'Invalid file type: {filename}',
-            'allowed': list(allowed_extensions),
+            'allowed': sorted(_EXCEL_EXTS),
             'hint': 'Please upload an Excel file (.xlsx, .xls, .xlsm)'
         }), 400
     
@@ -283,53 +428,56 @@ def extract_excel():
     # Determine suffix from filename
     suffix = '.' + filename.rsplit('.', 1)[1] if '.' in filename else '.xlsx'
     
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        file.save(tmp.name)
-        tmp_path = Path(tmp.name)
-    
+    # Small uploads: parse straight from memory (pandas/openpyxl accept
+    # file-likes), everything else streams chunked to a temp file
+    tmp_path = None
+    if request.content_length and request.content_length <= _IN_MEMORY_EXCEL_LIMIT:
+        upload = io.BytesIO(file.read())
+    else:
+        tmp_path = save_upload_to_temp(file, suffix)
+        upload = tmp_path
+
     try:
         # Extract
-        result = excel_reader.read_excel(tmp_path, process_all_sheets=process_all_sheets)
+        result = excel_reader.read_excel(upload, process_all_sheets=process_all_sheets,
+                                         source_name=file.filename)
         response = format_response(result)
         
         # Validate if requested
         if do_validate and result.success:
             errors = validator.validate(result.data)
             response['validation_errors'] = [
-                {
-                    'severity': e.severity,
-                    'row_index': e.row_index,
-                    'field': e.field,
-                    'message': e.message,
-                    'value': e.value
-                }
-                for e in errors
+                dict(zip(_VE_KEYS, _VE_GET(e))) for e in errors
             ]
-        
+
+        # Große Ergebnisse chunked streamen statt komplett zu puffern
+        if len(response['data']) >= _STREAM_ROW_THRESHOLD:
+            return Response(stream_with_context(iter_extract_json(response)),
+                            mimetype='application/json')
+
         return jsonify(response)
         
     except Exception as e:
-        return jsonify({
+        # format_exc() läuft den kompletten Stack ab - nur im Debug-Modus
+        error = {
             'success': False,
             'error': str(e),
-            'error_type': type(e).__name__,
-            'traceback': traceback.format_exc()
-        }), 500
-        
+            'error_type': type(e).__name__
+        }
+        if app.debug:
+            error['traceback'] = traceback.format_exc()
+        return jsonify(error), 500
+
     finally:
         # Cleanup
-        if tmp_path.exists():
+        if tmp_path is not None and tmp_path.exists():
             tmp_path.unlink()
 
-@app.route('/api/extract/pdf', methods=['POST', 'OPTIONS'])
+@app.route('/api/extract/pdf', methods=['POST'])
 def extract_pdf():
     """
     Extract rent roll data from PDF file.
     """
-    if request.method == 'OPTIONS':
-        return handle_options('extract/pdf')
-    
     if not PDF_SUPPORT:
         return jsonify({
             'success': False, 
@@ -345,31 +493,51 @@ def extract_pdf():
     if file.filename == '':
         return jsonify({'success': False, 'error': 'No file selected'}), 400
     
-    if not allowed_file(file.filename, {'pdf'}):
+    if not allowed_file(file.filename, _PDF_EXTS):
         return jsonify({
             'success': False, 
             'error': 'Invalid file type. Only PDF allowed',
             'filename': file.filename
         }), 400
     
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        file.save(tmp.name)
-        tmp_path = Path(tmp.name)
-    
+    # Parse options: Tabellenerkennung (pdfminer) ist teuer und für reine
+    # Text-Anfragen abschaltbar
+    include_tables = request.form.get('include_tables', 'true').lower() == 'true'
+
+    # Stream to temp file (chunked, no full in-memory buffering)
+    tmp_path = save_upload_to_temp(file, '.pdf')
+
     try:
-        # Extract text
-        text = extract_pdf_text(tmp_path)
-        
-        # Count pages and tables
-        page_count = 0
-        tables_found = 0
-        with pdfplumber.open(tmp_path) as pdf:
-            page_count = len(pdf.pages)
-            for page in pdf.pages:
-                tables = page.extract_tables()
-                tables_found += len([t for t in tables if t])
-        
+        if PYMUPDF_SUPPORT:
+            # Fast path: Text über MuPDFs C-Engine; pdfplumber/pdfminer wird
+            # nur noch für die Tabellenerkennung angeworfen.
+            with fitz.open(tmp_path) as doc:
+                page_count = doc.page_count
+                text = '\n'.join(page.get_text() for page in doc)
+
+            tables_found = 0
+            if include_tables:
+                with pdfplumber.open(tmp_path) as pdf:
+                    if page_count > 1:
+                        with ThreadPoolExecutor(max_workers=min(page_count, os.cpu_count() or 1)) as ex:
+                            tables_found = sum(ex.map(count_pdf_tables, pdf.pages))
+                    else:
+                        tables_found = sum(count_pdf_tables(page) for page in pdf.pages)
+        else:
+            # Fallback: ein einziger pdfplumber-Durchlauf (Text + Tabellen),
+            # Seiten parallel und in Originalreihenfolge via ex.map.
+            page_worker = partial(process_pdf_page, include_tables=include_tables)
+            with pdfplumber.open(tmp_path) as pdf:
+                page_count = len(pdf.pages)
+                if page_count > 1:
+                    with ThreadPoolExecutor(max_workers=min(page_count, os.cpu_count() or 1)) as ex:
+                        page_results = list(ex.map(page_worker, pdf.pages))
+                else:
+                    page_results = [page_worker(page) for page in pdf.pages]
+
+            text = '\n'.join(t for t, _ in page_results if t)
+            tables_found = sum(n for _, n in page_results)
+
         return jsonify({
             'success': True,
             'extracted_text': text,
@@ -381,30 +549,32 @@ def extract_pdf():
         })
         
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 500
-        
+        # format_exc() läuft den kompletten Stack ab - nur im Debug-Modus
+        error = {'success': False, 'error': str(e)}
+        if app.debug:
+            error['traceback'] = traceback.format_exc()
+        return jsonify(error), 500
+
     finally:
         # Cleanup
         if tmp_path.exists():
             tmp_path.unlink()
 
-@app.route('/api/parse/number', methods=['POST', 'OPTIONS'])
+@app.route('/api/parse/number', methods=['POST'])
 def parse_number():
     """Parse a number string with unit separation."""
-    if request.method == 'OPTIONS':
-        return handle_options('parse/number')
-    
     data = request.get_json()
     if not data or 'value' not in data:
         return jsonify({'success': False, 'error': 'No value provided'}), 400
-    
-    parser = NumberUnitParser()
-    result = parser.parse(data['value'], data.get('context'))
-    
+
+    value = data['value']
+    context = data.get('context')
+    if isinstance(value, (str, int, float)) or value is None:
+        result = _parse_number_cached(value, context if isinstance(context, str) else None)
+    else:
+        # Nicht hashbare Eingaben (Listen etc.) am Cache vorbei parsen
+        result = number_parser.parse(value, context)
+
     return jsonify({
         'success': True,
         'value': result.value,
@@ -412,12 +582,9 @@ def parse_number():
         'original': result.original_text
     })
 
-@app.route('/api/validate', methods=['POST', 'OPTIONS'])
+@app.route('/api/validate', methods=['POST'])
 def validate_data():
     """Validate extracted rent roll data."""
-    if request.method == 'OPTIONS':
-        return handle_options('validate')
-    
     data = request.get_json()
     if not data or 'data' not in data:
         return jsonify({'success': False, 'error': 'No data provided'}), 400
@@ -476,7 +643,10 @@ def main():
 ║  CORS:        ✅ Enabled for all origins                     ║
 ╚══════════════════════════════════════════════════════════════╝
 """)
-    
+
+    print("⚠️ Entwicklungs-Server (single process) - für Produktion:")
+    print("   gunicorn -c gunicorn.conf.py app:app")
+
     app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 if __name__ == '__main__':
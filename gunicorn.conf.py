@@ -0,0 +1,28 @@
+"""
+Gunicorn-Konfiguration für den Rent Roll API Server.
+
+Produktions-Start:
+    gunicorn -c gunicorn.conf.py app:app
+
+Der Flask-Dev-Server (app.run) läuft in einem einzigen Python-Prozess und
+kann CPU-gebundene Extraktionen nicht über mehrere Kerne verteilen. Hier:
+mehrere Worker-Prozesse (umgehen den GIL) mit je ein paar Threads für
+I/O-lastiges Upload-Handling.
+"""
+
+import multiprocessing
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '8080')
+
+workers = 2 * multiprocessing.cpu_count() + 1
+threads = 4
+worker_class = 'gthread'
+
+# Große Workbooks/PDFs können mehrere Minuten brauchen
+timeout = 300
+graceful_timeout = 30
+
+# Worker regelmäßig recyceln, damit pandas/pdfminer-Speicher nicht wächst
+max_requests = 500
+max_requests_jitter = 50
@@ -23,25 +23,61 @@ Basiert auf:
 - number_parsing_rules.json
 """
 
+import gc
 import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+# Optional: python-calamine (Rust) parst XLSX um Größenordnungen schneller
+# als openpyxl; ohne das Paket fällt alles auf pandas' Default-Engine zurück
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_SUPPORT = True
+except ImportError:
+    CALAMINE_SUPPORT = False
+
+# Optional: orjson serialisiert um ein Vielfaches schneller als json -
+# genutzt für den CLI-Output; Fallback bleibt das stdlib-json
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+
+def _open_excel(filepath) -> pd.ExcelFile:
+    """Open a workbook with the fastest available engine."""
+    if CALAMINE_SUPPORT:
+        try:
+            return pd.ExcelFile(filepath, engine='calamine')
+        except Exception:
+            # Unsupported/corrupt input: let pandas' own engine dispatch
+            # (openpyxl/xlrd by extension) have a go
+            if hasattr(filepath, 'seek'):
+                filepath.seek(0)
+    return pd.ExcelFile(filepath)
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumberWithUnit:
     """
     Represents a number separated from its unit.
     CRITICAL: This ensures no automatic conversion occurs.
+
+    Frozen + slots: one instance per parsed cell, so slot storage saves the
+    per-instance dict and immutability lets the parse cache share results.
     """
     value: Optional[float]
     unit: Optional[str]
@@ -85,6 +121,75 @@ class ValidationError:
 # NUMBER UNIT PARSER - CRITICAL COMPONENT
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _unit_strip_re(unit_lower: str) -> re.Pattern:
+    """Compiled pattern that strips a detected unit token from a cell.
+
+    Cached per unit string so the hot path never rebuilds the pattern and
+    never thrashes the 100-entry internal re cache.
+    """
+    return re.compile(r'\b' + re.escape(unit_lower) + r'\b')
+
+
+# Blank cells are extremely common in rent rolls (often >30% of a sheet);
+# NumberWithUnit is frozen, so every empty parse can share one instance
+_EMPTY_NWU = NumberWithUnit(None, None, '')
+
+
+# ----------------------------------------------------------------------------
+# Locale normalization handlers for _parse_numeric_string: one straight-line
+# function per separator combination, dispatched via a 3-bit key
+# (apostrophe, comma, dot) instead of a nested branch chain.
+# Each takes the digits+separators string and returns a '.'-decimal string.
+
+def _num_plain(s: str) -> str:
+    return s
+
+
+def _num_dot(s: str) -> str:
+    # Only dots: '1.234' is a thousands group, anything else stays as-is
+    # (multi-dot strings intentionally fall through to float() and fail)
+    parts = s.split('.')
+    if len(parts) == 2 and len(parts[1]) == 3:
+        return parts[0] + parts[1]
+    return s
+
+
+def _num_comma(s: str) -> str:
+    # Only commas: decide thousands vs decimal by the trailing group length
+    parts = s.split(',')
+    if len(parts) == 2 and len(parts[1]) <= 2:
+        return s.replace(',', '.')
+    return s.replace(',', '')
+
+
+def _num_both(s: str) -> str:
+    # Both present - the last separator is the decimal point
+    if s.rfind(',') > s.rfind('.'):
+        return s.replace('.', '').replace(',', '.')
+    return s.replace(',', '')
+
+
+def _num_apos(s: str) -> str:
+    return s.replace("'", '')
+
+
+def _num_apos_dot(s: str) -> str:
+    return _num_dot(s.replace("'", ''))
+
+
+def _num_apos_comma(s: str) -> str:
+    return _num_comma(s.replace("'", ''))
+
+
+def _num_apos_both(s: str) -> str:
+    return _num_both(s.replace("'", ''))
+
+
+_NUM_HANDLERS = (_num_plain, _num_dot, _num_comma, _num_both,
+                 _num_apos, _num_apos_dot, _num_apos_comma, _num_apos_both)
+
+
 class NumberUnitParser:
     """
     CRITICAL: Parses numbers with units WITHOUT conversion.
@@ -124,21 +229,69 @@ class NumberUnitParser:
         'square feet': 'sqft', 'square metres': 'm²', 'square meters': 'm²'
     }
     
+    # Other units: time units
+    TIME_UNITS = {
+        'jahre': 'Jahre', 'year': 'years', 'years': 'years', 'yr': 'years',
+        'monate': 'Monate', 'month': 'months', 'months': 'months', 'mo': 'months',
+        'tage': 'Tage', 'day': 'days', 'days': 'days',
+        'wochen': 'Wochen', 'week': 'weeks', 'weeks': 'weeks'
+    }
+
+    # Other units: magnitude units
+    MAGNITUDE_UNITS = {
+        'mio': 'mio', 'million': 'mio', 'mrd': 'mrd', 'billion': 'billion',
+        'tsd': 'tsd', 'thousand': 'thousand', 'k': 'k'
+    }
+
     # Approximate value prefixes
     APPROX_PREFIXES = ['approx.', 'ca.', '~', 'circa', 'ungefähr', 'environ', 'about', 'roughly']
     
     # Operators to remove
     OPERATORS = ['>=', '<=', '>', '<', '=', '≥', '≤']
-    
+
+    # ------------------------------------------------------------------
+    # Compiled patterns live at CLASS scope: they exist once per process
+    # no matter how many parsers get constructed (HeaderMapper and
+    # DataExtractor each build one per file).
+    # Currency symbols only - Fr. pattern removed to avoid false positives
+    currency_symbol_pattern = re.compile(r'([€$£¥₹元])')
+    # Lowercase-only sources, no re.IGNORECASE: parse() lowercases the
+    # working string once, so the SRE engine skips per-char casefolding
+    currency_code_pattern = re.compile(r'\b(eur|usd|gbp|chf|pln|sek|dkk|nok|czk|huf|cad|aud|inr|jpy|cny|nzd)\b')
+    percent_pattern = re.compile(r'(\d+(?:[.,]\d+)?)\s*%')
+    area_pattern = re.compile(r'(m²|m2|sqm|qm|sqft|sf|ft²|ft2|square\s*(?:feet|metres?|meters?))')
+    parentheses_negative = re.compile(r'^\s*\(([^)]+)\)\s*$')
+    number_pattern = re.compile(r"-?[\d.,']+")
+    # Strips everything that is not a digit or separator in ONE pass
+    # (replaces the per-cell re.findall + list + join in numeric parsing)
+    _non_numeric_re = re.compile(r"[^\d.,']+")
+    # Single alternation over all time/magnitude units; longest keys first
+    # so 'months' wins over 'mo'.
+    _other_unit_map = {**TIME_UNITS, **MAGNITUDE_UNITS}
+    _other_unit_pattern = re.compile(
+        r'\b(' + '|'.join(re.escape(k) for k in
+                          sorted(_other_unit_map, key=len, reverse=True)) + r')\b')
+    # Anchored prefix/operator strippers: one sub() each instead of a
+    # Python startswith-loop plus a full lowercase copy per parse
+    _prefix_re = re.compile(
+        r'^(?:' + '|'.join(re.escape(p) for p in APPROX_PREFIXES) + r')\s*')
+    _op_re = re.compile(
+        r'^(?:' + '|'.join(re.escape(op) for op in
+                           sorted(OPERATORS, key=len, reverse=True)) + r')\s*')
+    # Fused unit probe: currency symbol, currency code and area unit in
+    # ONE scan over the string; the winning group name dispatches to the
+    # specialized parser (percent stays a cheap '%' substring check).
+    _unit_probe = re.compile(
+        r'(?P<sym>[€$£¥₹元])'
+        r'|(?P<code>\b(?:eur|usd|gbp|chf|pln|sek|dkk|nok|czk|huf|cad|aud|inr|jpy|cny|nzd)\b)'
+        r'|(?P<area>m²|m2|sqm|qm|sqft|sf|ft²|ft2|square\s*(?:feet|metres?|meters?))')
+
     def __init__(self):
-        # Compile regex patterns
-        # Currency symbols only - Fr. pattern removed to avoid false positives
-        self.currency_symbol_pattern = re.compile(r'([€$£¥₹元])')
-        self.currency_code_pattern = re.compile(r'\b(EUR|USD|GBP|CHF|PLN|SEK|DKK|NOK|CZK|HUF|CAD|AUD|INR|JPY|CNY|NZD)\b', re.IGNORECASE)
-        self.percent_pattern = re.compile(r'(\d+(?:[.,]\d+)?)\s*%')
-        self.area_pattern = re.compile(r'(m²|m2|sqm|qm|sqft|sf|ft²|ft2|square\s*(?:feet|metres?|meters?))', re.IGNORECASE)
-        self.parentheses_negative = re.compile(r'^\s*\(([^)]+)\)\s*$')
-        self.number_pattern = re.compile(r"-?[\d.,']+")
+        # Only per-instance state left: the parse memo cache.
+        # Rent rolls repeat the same strings constantly ('0', '-', identical
+        # rents, unit codes): memoize per (string, hint), bounded FIFO
+        self._parse_cache: Dict[Tuple[str, Optional[str]], NumberWithUnit] = {}
+        self._parse_cache_max = 8192
     def parse(self, value: Any, context_hint: Optional[str] = None) -> NumberWithUnit:
         """
         Parse a value into number and unit WITHOUT conversion.
@@ -154,7 +307,7 @@ class NumberUnitParser:
         """
         # Handle None/NaN/empty
         if value is None or (isinstance(value, float) and pd.isna(value)):
-            return NumberWithUnit(None, None, '')
+            return _EMPTY_NWU
         
         # Handle pure numbers (already numeric)
         if isinstance(value, (int, float)) and not isinstance(value, bool):
@@ -164,37 +317,64 @@ class NumberUnitParser:
         original = str(value).strip()
         
         # Handle empty strings
-        if not original or original.lower() in ('', '-', '–', 'n/a', 'na', 'null', 'none', '00:00:00'):
+        if not original:
+            return _EMPTY_NWU
+        if original.lower() in ('-', '–', 'n/a', 'na', 'null', 'none', '00:00:00'):
             return NumberWithUnit(None, None, original)
-        
-        # Clean approximate prefixes and operators FIRST
-        cleaned = self._clean_prefixes(original)
+
+        # Fast path: plain integer strings (IDs, counts, years) need no
+        # prefix cleaning, no unit probing and no cache slot. Restricted to
+        # digits-only on purpose - dotted strings must go through the locale
+        # logic ('1.234' is a German thousands group, not one-point-two).
+        body = original[1:] if original[0] == '-' else original
+        if body.isascii() and body.isdigit():
+            return NumberWithUnit(float(original), None, original)
+
+        # Cached? NumberWithUnit is never mutated, so sharing results is safe
+        key = (original, context_hint)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._parse_str(original, context_hint)
+
+        if len(self._parse_cache) >= self._parse_cache_max:
+            self._parse_cache.pop(next(iter(self._parse_cache)))
+        self._parse_cache[key] = result
+        return result
+
+    def _parse_str(self, original: str, context_hint: Optional[str] = None) -> NumberWithUnit:
+        """Uncached string parsing behind parse()."""
+        # Lowercase ONCE and clean approximate prefixes/operators FIRST; all
+        # matching below runs case-sensitively on the lowered working string
+        # while 'original' keeps the untouched text for the output
+        cleaned = self._clean_prefixes(original.lower())
         
         # Check for percentage first
         if '%' in cleaned:
-            return self._parse_percentage(original)
-        
-        # Check for currency
-        if self.currency_symbol_pattern.search(cleaned) or self.currency_code_pattern.search(cleaned):
-            return self._parse_currency(original)
-        
-        # Check for area units
-        if self.area_pattern.search(cleaned):
-            return self._parse_area(original)
-        
+            return self._parse_percentage(original, cleaned)
+
+        # Check for currency or area unit - single fused scan
+        probe = self._unit_probe.search(cleaned)
+        if probe:
+            if probe.lastgroup == 'area':
+                return self._parse_area(original, cleaned)
+            return self._parse_currency(original, cleaned)
+
         # Check for other units (Jahre, months, mio, etc.)
         other_unit = self._extract_other_unit(cleaned)
         if other_unit:
-            return self._parse_with_unit(original, other_unit)
+            return self._parse_with_unit(original, other_unit, cleaned)
         
         # Pure number parsing - use cleaned string!
         number = self._parse_numeric_string(cleaned)
         return NumberWithUnit(number, None, original)
     
-    def _parse_percentage(self, text: str) -> NumberWithUnit:
+    def _parse_percentage(self, text: str, cleaned: Optional[str] = None) -> NumberWithUnit:
         """Parse percentage value: 95% → value: 95, unit: '%'"""
-        # Remove approximate prefixes and operators
-        cleaned = self._clean_prefixes(text)
+        # Prefixes/operators are already stripped when called via parse()
+        if cleaned is None:
+            cleaned = self._clean_prefixes(text.lower())
         
         match = self.percent_pattern.search(cleaned)
         if match:
@@ -206,12 +386,13 @@ class NumberUnitParser:
         number = self._parse_numeric_string(cleaned.replace('%', ''))
         return NumberWithUnit(number, '%', text)
     
-    def _parse_currency(self, text: str) -> NumberWithUnit:
+    def _parse_currency(self, text: str, cleaned: Optional[str] = None) -> NumberWithUnit:
         """
         Parse currency value: 1.000 € → value: 1000, unit: EUR
         CRITICAL: NEVER convert currencies.
         """
-        cleaned = self._clean_prefixes(text)
+        if cleaned is None:
+            cleaned = self._clean_prefixes(text.lower())
         
         # Find currency symbol or code
         currency = None
@@ -234,12 +415,13 @@ class NumberUnitParser:
         
         return NumberWithUnit(number, currency, text)
     
-    def _parse_area(self, text: str) -> NumberWithUnit:
+    def _parse_area(self, text: str, cleaned: Optional[str] = None) -> NumberWithUnit:
         """
         Parse area value: 500 m² → value: 500, unit: m²
         CRITICAL: NEVER convert sqft to m² or vice versa.
         """
-        cleaned = self._clean_prefixes(text)
+        if cleaned is None:
+            cleaned = self._clean_prefixes(text.lower())
         
         # Find area unit
         match = self.area_pattern.search(cleaned)
@@ -257,59 +439,48 @@ class NumberUnitParser:
         return NumberWithUnit(number, unit, text)
     
     def _extract_other_unit(self, text: str) -> Optional[str]:
-        """Extract other units like Jahre, months, mio, etc."""
-        text_lower = text.lower()
-        
-        # Common time units
-        time_units = {
-            'jahre': 'Jahre', 'year': 'years', 'years': 'years', 'yr': 'years',
-            'monate': 'Monate', 'month': 'months', 'months': 'months', 'mo': 'months',
-            'tage': 'Tage', 'day': 'days', 'days': 'days',
-            'wochen': 'Wochen', 'week': 'weeks', 'weeks': 'weeks'
-        }
-        
-        # Magnitude units
-        magnitude_units = {
-            'mio': 'mio', 'million': 'mio', 'mrd': 'mrd', 'billion': 'billion',
-            'tsd': 'tsd', 'thousand': 'thousand', 'k': 'k'
-        }
-        
-        # Check for matches
-        for key, val in {**time_units, **magnitude_units}.items():
-            pattern = r'\b' + re.escape(key) + r'\b'
-            if re.search(pattern, text_lower):
-                return val
-        
-        return None
+        """Extract other units like Jahre, months, mio, etc. (expects lowercase)."""
+        match = self._other_unit_pattern.search(text)
+        return self._other_unit_map[match.group(1)] if match else None
     
-    def _parse_with_unit(self, text: str, unit: str) -> NumberWithUnit:
+    def _parse_with_unit(self, text: str, unit: str, cleaned: Optional[str] = None) -> NumberWithUnit:
         """Parse a value with a detected unit."""
-        cleaned = self._clean_prefixes(text)
-        
-        # Remove the unit
-        for key in [unit.lower(), unit]:
-            cleaned = re.sub(r'\b' + re.escape(key) + r'\b', '', cleaned, flags=re.IGNORECASE)
+        if cleaned is None:
+            cleaned = self._clean_prefixes(text.lower())
+
+        # Remove the unit (cleaned is lowercase, so one sub suffices)
+        cleaned = _unit_strip_re(unit.lower()).sub('', cleaned)
         
         number = self._parse_numeric_string(cleaned)
         return NumberWithUnit(number, unit, text)
     
+    def parse_series(self, series: pd.Series, context_hint: Optional[str] = None) -> pd.DataFrame:
+        """
+        Parse a whole column in one batch.
+
+        Returns a DataFrame aligned with the input index, columns
+        'value'/'unit'/'original' mirroring NumberWithUnit.
+
+        Columns repeat values heavily, so this parses each UNIQUE value once
+        and broadcasts the results with factorize codes - same semantics as
+        parse() per cell (no second, vectorized locale implementation to keep
+        in sync), but the per-row Python call frames disappear.
+        """
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        parsed = [self.parse(v, context_hint) for v in uniques]
+        values = np.array([p.value for p in parsed], dtype=object)
+        units = np.array([p.unit for p in parsed], dtype=object)
+        originals = np.array([p.original_text for p in parsed], dtype=object)
+        return pd.DataFrame({
+            'value': values[codes],
+            'unit': units[codes],
+            'original': originals[codes],
+        }, index=series.index)
+
     def _clean_prefixes(self, text: str) -> str:
         """Remove approximate prefixes and operators."""
-        cleaned = text.strip()
-        
-        # Remove approximate prefixes (case-insensitive)
-        for prefix in self.APPROX_PREFIXES:
-            if cleaned.lower().startswith(prefix.lower()):
-                cleaned = cleaned[len(prefix):].strip()
-                break
-        
-        # Remove operators
-        for op in self.OPERATORS:
-            if cleaned.startswith(op):
-                cleaned = cleaned[len(op):].strip()
-                break
-        
-        return cleaned
+        cleaned = self._prefix_re.sub('', text.strip(), count=1)
+        return self._op_re.sub('', cleaned, count=1)
     
     def _parse_numeric_string(self, text: str) -> Optional[float]:
         """
@@ -327,11 +498,12 @@ class NumberUnitParser:
         
         cleaned = text.strip()
         
-        # Handle negative numbers in parentheses (accounting format)
+        # Handle negative numbers in parentheses (accounting format) -
+        # cheap endpoint checks instead of a regex match
         is_negative = False
-        paren_match = self.parentheses_negative.match(cleaned)
-        if paren_match:
-            cleaned = paren_match.group(1)
+        if len(cleaned) > 2 and cleaned[0] == '(' and cleaned[-1] == ')' \
+                and ')' not in cleaned[1:-1]:
+            cleaned = cleaned[1:-1]
             is_negative = True
         elif cleaned.startswith('-'):
             is_negative = True
@@ -339,67 +511,29 @@ class NumberUnitParser:
         elif cleaned.startswith('−'):  # Unicode minus
             is_negative = True
             cleaned = cleaned[1:]
-        
-        # Extract just the numeric part
-        numeric_chars = re.findall(r"[\d.,']", cleaned)
-        if not numeric_chars:
+
+        # Extract just the numeric part (single C-level pass, no char list)
+        num_str = self._non_numeric_re.sub('', cleaned)
+        if not num_str:
             return None
         
-        num_str = ''.join(numeric_chars)
-        
-        # Determine locale format
-        has_comma = ',' in num_str
-        has_dot = '.' in num_str
-        has_apostrophe = "'" in num_str
-        
-        # Swiss format: 1'234.56
-        if has_apostrophe:
-            num_str = num_str.replace("'", "")
-            # After removing apostrophes, treat as US format
-            has_comma = ',' in num_str
-            has_dot = '.' in num_str
-        
+        # Locale dispatch: 3-bit key over which separators occur, handled by
+        # a straight-line function from the module-level table (European
+        # 1.234,56 / US 1,234.56 / Swiss 1'234.56 all covered)
+        idx = (("'" in num_str) << 2) | ((',' in num_str) << 1) | ('.' in num_str)
+
         try:
-            if has_comma and has_dot:
-                # Both present - last separator is decimal
-                last_comma = num_str.rfind(',')
-                last_dot = num_str.rfind('.')
-                
-                if last_comma > last_dot:
-                    # European: 1.234,56
-                    num_str = num_str.replace('.', '').replace(',', '.')
-                else:
-                    # US: 1,234.56
-                    num_str = num_str.replace(',', '')
-            
-            elif has_comma and not has_dot:
-                # Only comma - check position
-                parts = num_str.split(',')
-                if len(parts) == 2 and len(parts[1]) == 3:
-                    # Likely thousand separator: 1,234
-                    num_str = num_str.replace(',', '')
-                elif len(parts) == 2 and len(parts[1]) <= 2:
-                    # Likely decimal: 1234,56
-                    num_str = num_str.replace(',', '.')
-                else:
-                    # Multiple commas - thousand separators
-                    num_str = num_str.replace(',', '')
-            
-            elif has_dot and not has_comma:
-                # Only dot - check position
-                parts = num_str.split('.')
-                if len(parts) == 2 and len(parts[1]) == 3:
-                    # Likely thousand separator: 1.234
-                    num_str = num_str.replace('.', '')
-                # else: treat as decimal
-            
-            result = float(num_str)
+            result = float(_NUM_HANDLERS[idx](num_str))
             return -abs(result) if is_negative else result
-            
         except (ValueError, TypeError):
             return None
 
 
+# Shared default parser: patterns are class-level anyway, and sharing one
+# instance lets HeaderMapper and DataExtractor reuse the same parse cache
+_DEFAULT_PARSER = NumberUnitParser()
+
+
 # ============================================================================
 # HEADER MAPPER
 # ============================================================================
@@ -509,11 +643,45 @@ class HeaderMapper:
     
     def __init__(self, synonyms_file: Optional[Path] = None):
         self.synonyms = self.DEFAULT_SYNONYMS.copy()
-        self.parser = NumberUnitParser()
-        
+        self.parser = _DEFAULT_PARSER
+
         # Load additional synonyms from file if provided
         if synonyms_file and synonyms_file.exists():
             self._load_synonyms_file(synonyms_file)
+
+        # Memoize normalization: the same header strings (and all synonym
+        # strings) get normalized over and over during sheet scanning.
+        # map_header gets the same treatment - identical cell strings hit it
+        # thousands of times across preview scans and header detection - and
+        # get_field_type_hint is a tiny dict probe worth one cache line.
+        self.normalize_header = lru_cache(maxsize=4096)(self.normalize_header)
+        self.map_header = lru_cache(maxsize=2048)(self.map_header)
+        self.get_field_type_hint = lru_cache(maxsize=256)(self.get_field_type_hint)
+
+        # Precompute normalized lookup structures so map_header is a dict
+        # hit instead of re-normalizing ~200 synonyms per call
+        self._build_lookup()
+
+    def _build_lookup(self):
+        """Build normalized synonym lookup tables (called once per mapper)."""
+        self._exact = {}          # normalized synonym -> canonical
+        self._substring_map = {}  # normalized synonym -> canonical, len > 3
+        for canonical, syns in self.synonyms.items():
+            for syn in syns:
+                norm = self.normalize_header(syn)
+                if not norm:
+                    continue
+                self._exact.setdefault(norm, canonical)
+                if len(syn) > 3:
+                    self._substring_map.setdefault(norm, canonical)
+        # One alternation regex scans the header once instead of looping over
+        # every synonym; longest synonyms first so the most specific one wins.
+        # No \b anchors: synonyms must match inside compounds ('Gesamtmiete').
+        if self._substring_map:
+            self._substring_re = re.compile('|'.join(
+                re.escape(n) for n in sorted(self._substring_map, key=len, reverse=True)))
+        else:
+            self._substring_re = None
     
     def _load_synonyms_file(self, filepath: Path):
         """Load synonyms from JSON file."""
@@ -545,53 +713,47 @@ class HeaderMapper:
         normalized = self.normalize_header(raw_header)
         if not normalized:
             return None
-        
-        for canonical, synonyms in self.synonyms.items():
-            for syn in synonyms:
-                if self.normalize_header(syn) == normalized:
-                    return canonical
-                # Also check if normalized contains the synonym
-                if len(syn) > 3 and self.normalize_header(syn) in normalized:
-                    return canonical
-        
+
+        # Exact match: O(1) dict lookup
+        canonical = self._exact.get(normalized)
+        if canonical:
+            return canonical
+
+        # Fallback: check if the header contains a known synonym
+        if self._substring_re:
+            match = self._substring_re.search(normalized)
+            if match:
+                return self._substring_map[match.group(0)]
+
         return None
     
     def get_field_type_hint(self, canonical_field: str) -> Optional[str]:
         """Get the type hint for a canonical field."""
         return self.FIELD_TYPE_HINTS.get(canonical_field)
     
+    # One precompiled alternation per language (longest words first so
+    # 'mieter' wins over 'miete'); no \b anchors, keywords must also hit
+    # inside compounds like 'Hauptmieter' or 'Mietfläche'
+    _LANG_RES = {
+        'de': re.compile(r'mieter|vertrag|einheit|nutzung|fläche|miete'),
+        'fr': re.compile(r'locataire|surface|unité|loyer|bail'),
+        'it': re.compile(r'superficie|locazione|inquilino|affitto'),
+        'nl': re.compile(r'oppervlakte|huurder|eenheid|huur'),
+        'pl': re.compile(r'powierzchnia|najemca|czynsz|umowa'),
+    }
+
     def detect_language(self, headers: List[str]) -> str:
         """Detect primary language from headers."""
-        lang_scores = {'en': 0, 'de': 0, 'fr': 0, 'it': 0, 'nl': 0, 'pl': 0, 'sv': 0}
-        
-        de_words = ['mieter', 'fläche', 'miete', 'vertrag', 'einheit', 'nutzung']
-        fr_words = ['locataire', 'loyer', 'bail', 'surface', 'unité']
-        it_words = ['inquilino', 'affitto', 'locazione', 'superficie']
-        nl_words = ['huurder', 'huur', 'oppervlakte', 'eenheid']
-        pl_words = ['najemca', 'czynsz', 'powierzchnia', 'umowa']
-        
-        for header in headers:
-            h_lower = str(header).lower()
-            for word in de_words:
-                if word in h_lower:
-                    lang_scores['de'] += 1
-            for word in fr_words:
-                if word in h_lower:
-                    lang_scores['fr'] += 1
-            for word in it_words:
-                if word in h_lower:
-                    lang_scores['it'] += 1
-            for word in nl_words:
-                if word in h_lower:
-                    lang_scores['nl'] += 1
-            for word in pl_words:
-                if word in h_lower:
-                    lang_scores['pl'] += 1
-        
+        # Join the headers once and run one findall per language in C
+        # instead of a headers x languages x keywords Python loop
+        text = ' '.join(str(h).lower() for h in headers)
+        lang_scores = {lang: len(rx.findall(text))
+                       for lang, rx in self._LANG_RES.items()}
+
         # Default to English if no other language detected
         if all(v == 0 for v in lang_scores.values()):
             return 'en'
-        
+
         return max(lang_scores, key=lang_scores.get)
 
 
@@ -622,19 +784,35 @@ class SheetSelector:
         'index', 'inhaltsverzeichnis', 'cover', 'deckblatt',
         'template', 'vorlage', 'example', 'beispiel'
     ]
+
+    # One compiled alternation per keyword list: a single search instead of
+    # 15+ Python-level substring checks per sheet name
+    _SHEET_RE = re.compile('|'.join(re.escape(k) for k in SHEET_KEYWORDS))
+    _SKIP_RE = re.compile('|'.join(re.escape(k) for k in SKIP_KEYWORDS))
     
     def __init__(self, mapper: HeaderMapper):
         self.mapper = mapper
-    
+        # First-30-rows previews, keyed per workbook object: select_best_sheet,
+        # get_all_data_sheets and language detection all want the same rows,
+        # and every pd.read_excel re-decodes the sheet XML from scratch
+        self._preview_cache: Dict[Tuple[int, str], pd.DataFrame] = {}
+
+    def get_preview(self, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """Return the first 30 rows of a sheet, parsed at most once."""
+        key = (id(excel_file), sheet_name)
+        df = self._preview_cache.get(key)
+        if df is None:
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=30, header=None)
+            self._preview_cache[key] = df
+        return df
+
     def should_skip_sheet(self, sheet_name: str) -> bool:
         """Check if a sheet should be skipped based on its name."""
-        name_lower = sheet_name.lower().strip()
-        return any(kw in name_lower for kw in self.SKIP_KEYWORDS)
-    
+        return bool(self._SKIP_RE.search(sheet_name.lower()))
+
     def is_likely_rent_roll(self, sheet_name: str) -> bool:
         """Check if sheet name indicates a rent roll."""
-        name_lower = sheet_name.lower().strip()
-        return any(kw in name_lower for kw in self.SHEET_KEYWORDS)
+        return bool(self._SHEET_RE.search(sheet_name.lower()))
     
     def select_best_sheet(self, excel_file: pd.ExcelFile) -> Optional[str]:
         """
@@ -662,7 +840,7 @@ class SheetSelector:
             
             # Check header matches in sheet
             try:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=30, header=None)
+                df = self.get_preview(excel_file, sheet_name)
                 header_matches = self._count_header_matches(df)
                 score += header_matches
             except:
@@ -687,7 +865,7 @@ class SheetSelector:
             
             # Quick check if sheet has any recognizable headers
             try:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=30, header=None)
+                df = self.get_preview(excel_file, sheet_name)
                 if self._count_header_matches(df) > 0:
                     data_sheets.append(sheet_name)
             except:
@@ -701,13 +879,12 @@ class SheetSelector:
     
     def _count_header_matches(self, df: pd.DataFrame) -> int:
         """Count how many recognizable headers are in the sheet."""
-        count = 0
-        for row_idx in range(min(30, len(df))):
-            row = df.iloc[row_idx]
-            for cell in row:
-                if self.mapper.map_header(str(cell)):
-                    count += 1
-        return count
+        # Preview sheets are mostly repeated blanks/values: map each UNIQUE
+        # cell string once and weight by its occurrence count instead of
+        # calling map_header per cell in a Python double loop
+        cells = pd.Series(df.iloc[:30].values.ravel()).astype(str)
+        counts = cells.value_counts()
+        return int(sum(n for v, n in counts.items() if self.mapper.map_header(v)))
 
 
 # ============================================================================
@@ -730,14 +907,17 @@ class HeaderDetector:
         best_row = None
         best_score = 0
         best_headers = []
-        
-        for row_idx in range(min(max_rows, len(df))):
-            row = df.iloc[row_idx]
-            headers = [str(cell) if not pd.isna(cell) else '' for cell in row]
-            
+
+        # One numpy object array for the scanned block: arr[row_idx] is a
+        # view, not a freshly allocated pandas Series per row
+        arr = df.iloc[:max_rows].values
+        for row_idx in range(arr.shape[0]):
+            # v != v catches NaN/NaT without a pd.isna call per cell
+            headers = ['' if v is None or v != v else str(v) for v in arr[row_idx]]
+
             # Count recognized headers
             score = sum(1 for h in headers if self.mapper.map_header(h))
-            
+
             if score > best_score:
                 best_score = score
                 best_row = row_idx
@@ -787,10 +967,22 @@ class DataExtractor:
         'grand total', 'subtotal', 'zwischensumme',
         'vacant', 'vacancy', 'leerstand'
     ]
-    
+
+    # Single alternation instead of 16 Python substring checks per row;
+    # no \b anchors so keywords keep matching inside longer cell text
+    SUMMARY_RE = re.compile('|'.join(re.escape(k) for k in SUMMARY_KEYWORDS))
+
+    # Canonical fields that are always treated as text (no numeric conversion)
+    TEXT_FIELDS = frozenset({
+        'tenant_name', 'unit_id', 'status', 'usage_type', 'lease_type',
+        # Extended text fields
+        'contract_id', 'contractual_partner', 'sap_object_number', 'composite_unit_id',
+        'mo_number', 'business_unit', 'business_unit_code', 'bookkeeping_area'
+    })
+
     def __init__(self, mapper: HeaderMapper):
         self.mapper = mapper
-        self.parser = NumberUnitParser()
+        self.parser = _DEFAULT_PARSER
     
     def extract_data(self, df: pd.DataFrame, header_row: int, 
                      raw_headers: List[str]) -> List[Dict[str, Any]]:
@@ -803,22 +995,68 @@ class DataExtractor:
         
         # Map headers to canonical names
         mapped_headers = [self.mapper.map_header(h) for h in raw_headers]
-        
+
+        # One object ndarray for the whole sheet: each row below is a plain
+        # numpy view instead of a freshly built pd.Series per df.iloc call
+        arr = df.to_numpy(dtype=object, copy=False)
+        n_cols = arr.shape[1]
+
+        # Only the mapped columns matter in the row loop; resolve the type
+        # hint, the text-field flag and the three output key strings once per
+        # sheet instead of per cell (f-string formatting is per-cell cost)
+        col_meta = [(i, c, self.mapper.get_field_type_hint(c), c in self.TEXT_FIELDS,
+                     (c + '_value', c + '_unit', c + '_original'))
+                    for i, c in enumerate(mapped_headers)
+                    if c is not None and i < n_cols]
+
+        # Find the summary/total boundary in ONE vectorized pass over the
+        # first column instead of re-checking it per row in the loop
+        data_end = arr.shape[0]
+        if n_cols and data_end > header_row + 1:
+            first_col = pd.Series(arr[header_row + 1:, 0]).astype(str).str.lower()
+            summary_mask = first_col.str.contains(self.SUMMARY_RE, na=False)
+            if summary_mask.any():
+                data_end = header_row + 1 + int(summary_mask.to_numpy().argmax())
+
+        # Vectorized empty-row mask for the whole data block: a cell counts
+        # as empty when it is NaN or whitespace-only text - two C-level
+        # passes instead of per-row str()/strip() generators in the loop
+        start = header_row + 1
+        block = pd.DataFrame(arr[start:data_end])
+        if len(block):
+            empty_mask = (block.isna()
+                          | block.astype(str).apply(lambda s: s.str.strip() == '')
+                          ).all(axis=1).to_numpy()
+        else:
+            empty_mask = np.zeros(0, dtype=bool)
+
+        # Batch-parse every mapped column over the data block: factorize
+        # finds the unique values, each unique is parsed ONCE and the
+        # NumberWithUnit results are broadcast back - columns repeat values
+        # heavily, so the per-cell parse calls collapse per column
+        parse = self.parser.parse
+        parsed_cols = []
+        for col_idx, _canonical, type_hint, _is_text, _unit_keys in col_meta:
+            codes, uniques = pd.factorize(
+                pd.Series(arr[start:data_end, col_idx]), use_na_sentinel=False)
+            parsed_uniques = np.empty(len(uniques), dtype=object)
+            for k, v in enumerate(uniques):
+                parsed_uniques[k] = parse(v, type_hint)
+            parsed_cols.append(parsed_uniques[codes])
+
+        # Specialize the row processor for this sheet's schema (see
+        # _compile_row_processor); it assembles records from the pre-parsed
+        # column arrays
+        process_row = self._compile_row_processor(col_meta)
+
         # Process each data row
-        for row_idx in range(header_row + 1, len(df)):
-            row = df.iloc[row_idx]
-            
-            # Check for summary/end row
-            first_cell = str(row.iloc[0]) if not pd.isna(row.iloc[0]) else ''
-            if self._is_summary_row(first_cell):
-                break
-            
+        for row_idx in range(start, data_end):
             # Check for empty row
-            if row.isna().all() or all(str(cell).strip() == '' for cell in row if not pd.isna(cell)):
+            if empty_mask[row_idx - start]:
                 continue
-            
+
             # Extract record
-            record = self._process_row(row, mapped_headers, row_idx)
+            record = process_row(row_idx - start, parsed_cols)
             
             # Only add if record has meaningful data
             if self._has_meaningful_data(record):
@@ -827,44 +1065,86 @@ class DataExtractor:
         
         return records
     
-    def _process_row(self, row: pd.Series, mapped_headers: List[str], 
-                     row_idx: int) -> Dict[str, Any]:
+    def _compile_row_processor(self, col_meta):
         """
-        Process a single row, separating values from units.
+        Generate a row processor specialized to one sheet's column schema.
+
+        col_meta is constant for every data row of a sheet, so the generic
+        _process_row spends much of its time looping over it and branching
+        on per-column flags that never change. This emits straight-line
+        source with the output keys and text/numeric branch baked in
+        (partial evaluation), compiles it once per sheet and returns the
+        function. It consumes the pre-parsed column arrays built in
+        extract_data (i is the 0-based offset into the data block).
+        Semantics are identical to _process_row, which remains as the
+        readable row-at-a-time reference implementation.
+        """
+        lines = ['def _row_processor(i, cols):', '    record = {}']
+        for j, (col_idx, canonical, type_hint, is_text, unit_keys) in enumerate(col_meta):
+            value_key, unit_key, original_key = unit_keys
+            lines += [
+                f'    parsed = cols[{j}][i]',
+                '    if parsed.unit:',
+                f'        record[{value_key!r}] = parsed.value',
+                f'        record[{unit_key!r}] = parsed.unit',
+                f'        record[{original_key!r}] = parsed.original_text',
+            ]
+            if is_text:
+                lines += [
+                    '    else:',
+                    '        orig = parsed.original_text if parsed.original_text is not None else (',
+                    "            str(parsed.value) if parsed.value is not None else '')",
+                    f'        record[{canonical!r}] = orig.strip() if isinstance(orig, str) else orig',
+                ]
+            else:
+                lines += [
+                    '    elif parsed.value is not None:',
+                    f'        record[{canonical!r}] = parsed.value',
+                    '    elif parsed.original_text:',
+                    f'        record[{canonical!r}] = parsed.original_text',
+                ]
+        lines.append('    return record')
+        namespace = {}
+        exec(compile('\n'.join(lines), '<row_processor>', 'exec'), namespace)
+        return namespace['_row_processor']
+
+    def _process_row(self, row: np.ndarray,
+                     col_meta: List[Tuple[int, str, Optional[str], bool,
+                                          Tuple[str, str, str]]]) -> Dict[str, Any]:
+        """
+        Process a single row (numpy view), separating values from units.
         
         CRITICAL: This implements the value/unit/original separation required for 98%+ accuracy.
         """
         record = {}
-        
-        for col_idx, canonical in enumerate(mapped_headers):
-            if canonical is None or col_idx >= len(row):
-                continue
-            
-            value = row.iloc[col_idx]
+        parse = self.parser.parse  # LOAD_FAST in the cell loop
 
-            # Get type hint for better parsing
-            type_hint = self.mapper.get_field_type_hint(canonical)
+        for col_idx, canonical, type_hint, is_text, unit_keys in col_meta:
+            value = row[col_idx]
+
+            # Already-numeric cells (the bulk of a rent roll) bypass the
+            # parser; mirrors exactly what parse() returns for them: the
+            # string form for text fields, float otherwise. type() instead
+            # of isinstance keeps bool (and exotic subclasses) on the slow
+            # path, and value == value filters NaN.
+            vt = type(value)
+            if (vt is float or vt is int) and value == value:
+                record[canonical] = str(value) if is_text else float(value)
+                continue
 
             # Parse value with unit separation
-            parsed = self.parser.parse(value, type_hint)
-
-            # Define canonical fields that should always be treated as text (no numeric conversion)
-            text_fields = [
-                'tenant_name', 'unit_id', 'status', 'usage_type', 'lease_type',
-                # Extended text fields
-                'contract_id', 'contractual_partner', 'sap_object_number', 'composite_unit_id',
-                'mo_number', 'business_unit', 'business_unit_code', 'bookkeeping_area'
-            ]
+            parsed = parse(value, type_hint)
 
             # Store with proper field naming
             # CRITICAL: Separate fields for value, unit, and original
             if parsed.unit:
-                record[f'{canonical}_value'] = parsed.value
-                record[f'{canonical}_unit'] = parsed.unit
-                record[f'{canonical}_original'] = parsed.original_text
+                value_key, unit_key, original_key = unit_keys
+                record[value_key] = parsed.value
+                record[unit_key] = parsed.unit
+                record[original_key] = parsed.original_text
             else:
                 # If this canonical field is designated as a text field, preserve original text
-                if canonical in text_fields:
+                if is_text:
                     # Use the original string representation (if None, fallback to parsed.value)
                     orig = parsed.original_text if parsed.original_text is not None else (
                         str(parsed.value) if parsed.value is not None else ''
@@ -882,22 +1162,29 @@ class DataExtractor:
     
     def _is_summary_row(self, first_cell: str) -> bool:
         """Check if this row is a summary/total row."""
-        cell_lower = first_cell.lower().strip()
-        return any(kw in cell_lower for kw in self.SUMMARY_KEYWORDS)
-    
+        return bool(self.SUMMARY_RE.search(first_cell.lower()))
+    
+    # A record is considered meaningful if at least one of these fields is present.
+    # In addition to tenant_name and unit_id, include fallback identifiers and
+    # other IDs such as contractual_partner, contract_id, sap_object_number,
+    # mo_number, and bookkeeping_area. Also include any rent or area values.
+    MEANINGFUL_FIELDS = (
+        'tenant_name', 'unit_id', 'monthly_rent_value', 'annual_rent_value',
+        'area_sqm_value', 'area_sqft_value',
+        'contractual_partner', 'contract_id', 'sap_object_number',
+        'mo_number', 'bookkeeping_area'
+    )
+
     def _has_meaningful_data(self, record: Dict[str, Any]) -> bool:
         """Check if record has at least some meaningful data."""
-        # A record is considered meaningful if at least one of these fields is present.
-        # In addition to tenant_name and unit_id, include fallback identifiers and
-        # other IDs such as contractual_partner, contract_id, sap_object_number,
-        # mo_number, and bookkeeping_area. Also include any rent or area values.
-        meaningful_fields = [
-            'tenant_name', 'unit_id', 'monthly_rent_value', 'annual_rent_value',
-            'area_sqm_value', 'area_sqft_value',
-            'contractual_partner', 'contract_id', 'sap_object_number',
-            'mo_number', 'bookkeeping_area'
-        ]
-        return any(record.get(f) not in [None, '', 0] for f in meaningful_fields)
+        # Runs once per row: bound getter, no list rebuilt per call, and an
+        # early return on the first hit (== keeps 0 == 0.0 == False folding)
+        get = record.get
+        for f in self.MEANINGFUL_FIELDS:
+            v = get(f)
+            if v is not None and v != '' and v != 0:
+                return True
+        return False
 
 
 # ============================================================================
@@ -912,11 +1199,37 @@ class RentRollExcelReader:
     """
     
     def __init__(self, synonyms_file: Optional[Path] = None):
+        self.synonyms_file = synonyms_file  # kept for worker processes
         self.mapper = HeaderMapper(synonyms_file)
         self.sheet_selector = SheetSelector(self.mapper)
         self.header_detector = HeaderDetector(self.mapper)
         self.data_extractor = DataExtractor(self.mapper)
 
+    def _extract_sheet(self, excel_file: pd.ExcelFile,
+                       sheet_name: str) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+        """
+        Extract one sheet: returns (records, warnings, raw_headers).
+
+        Shared by the serial loop and the process-pool workers; records come
+        back WITHOUT the _source_* fields, which read_excel adds.
+        """
+        df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+
+        header_result = self.header_detector.find_header_row(df)
+        if not header_result:
+            return [], [f"Sheet '{sheet_name}': Could not detect header row"], []
+
+        header_row, raw_headers = header_result
+
+        # Handle multi-level headers - only worth the merge pass when the row
+        # above the header actually has content; over blanks it is a no-op
+        # that would just re-stringify every header cell
+        if header_row > 0 and not df.iloc[header_row - 1].isna().all():
+            raw_headers = self.header_detector.handle_multi_level_headers(df, header_row)
+
+        records = self.data_extractor.extract_data(df, header_row, raw_headers)
+        return records, [], raw_headers
+
     def _is_phone_number(self, text: str) -> bool:
         """
         Heuristically determine if the provided numeric string looks like a phone number.
@@ -929,16 +1242,16 @@ class RentRollExcelReader:
         if not text:
             return False
         # Remove whitespace and typical separators
-        cleaned = re.sub(r'[\s\-]', '', str(text))
+        cleaned = str(text).translate(_PHONE_STRIP)
+        if not cleaned:
+            return False
         # Patterns that indicate a phone number
         # Starts with + followed by 2–3 digit country code
-        if cleaned.startswith('+'):
-            digits = re.sub(r'\D', '', cleaned)
-            return len(digits) >= 9  # phone numbers typically longer
+        if cleaned[0] == '+':
+            return sum(c.isdigit() for c in cleaned) >= 9  # phone numbers typically longer
         # German local numbers often start with 0 or 01/015/017 etc.
-        if cleaned.startswith(('01', '02', '03', '04', '05', '06', '07', '08', '09')):
-            digits = re.sub(r'\D', '', cleaned)
-            return len(digits) >= 9
+        if cleaned[0] == '0' and cleaned[1:2] in ('1', '2', '3', '4', '5', '6', '7', '8', '9'):
+            return sum(c.isdigit() for c in cleaned) >= 9
         return False
 
     def _resolve_tenant_and_unit(self, records: List[Dict[str, Any]]) -> None:
@@ -955,32 +1268,27 @@ class RentRollExcelReader:
           mo_number.
         - Assigns asset_id from sap_object_number when available.
         """
+        if not records:
+            return
+
+        # Vectorized prepass: find digit-only tenant names (candidate tenant
+        # IDs, e.g. 62210 or '62210.0' from Excel) with two C string kernels
+        # instead of two regex calls per record. Only the few candidates then
+        # go through the phone-number heuristic and targeted dict updates, so
+        # each record keeps exactly the keys it had.
+        tenants = pd.Series([r.get('tenant_name') for r in records], dtype=object)
+        mask = tenants.notna() & (tenants != '')
+        cleaned = tenants[mask].astype(str).str.strip().str.replace(r'\.0+$', '', regex=True)
+        for i in cleaned.index[cleaned.str.fullmatch(r'\d+')]:
+            num_str = cleaned[i]
+            # Distinguish between tenant ID and phone number
+            if not self._is_phone_number(num_str):
+                # Assign as tenant_id and drop tenant_name to avoid duplication
+                records[i]['tenant_id'] = num_str
+                del records[i]['tenant_name']
+
         for record in records:
             # -----------------------------------------------------------------
-            # Tenant resolution
-            tenant_value = record.get('tenant_name')
-            # If a numeric tenant name exists, check if it's actually a tenant ID
-            if tenant_value is not None and tenant_value != '':
-                # Only consider if it's purely numeric (possibly with .0 from Excel)
-                try:
-                    # Convert floats like 62210.0 to integer-like string
-                    if isinstance(tenant_value, (int, float)):
-                        num_str = str(int(float(tenant_value)))
-                    else:
-                        num_str = str(tenant_value).strip()
-                    # Remove trailing .0 if present
-                    num_str = re.sub(r'\.0+$', '', num_str)
-                    # Check if string consists of digits only
-                    if re.fullmatch(r'\d+', num_str):
-                        # Distinguish between tenant ID and phone number
-                        if not self._is_phone_number(num_str):
-                            # Assign as tenant_id and clear tenant_name
-                            record['tenant_id'] = num_str
-                            # Remove tenant_name to avoid duplication
-                            del record['tenant_name']
-                except Exception:
-                    pass
-
             # If tenant_name still missing, fallback to contractual_partner
             if not record.get('tenant_name') and not record.get('tenant_id'):
                 partner = record.get('contractual_partner')
@@ -1027,91 +1335,130 @@ class RentRollExcelReader:
             if record.get('sap_object_number') and not record.get('asset_id'):
                 record['asset_id'] = record['sap_object_number']
     
-    def read_excel(self, filepath: Path, process_all_sheets: bool = True) -> ExtractionResult:
+    def read_excel(self, filepath: Union[Path, str, BinaryIO],
+                   process_all_sheets: bool = True,
+                   source_name: Optional[str] = None,
+                   workers: int = 1,
+                   include_metadata: bool = True) -> ExtractionResult:
         """
         Read and extract rent roll from Excel file.
-        
+
         CRITICAL: When process_all_sheets=True, processes ALL sheets and adds
         _source_file and _source_sheet to each record.
+
+        filepath may be a Path/str or an open binary file-like object (e.g.
+        BytesIO for uploads that never touch disk). For file-like inputs,
+        source_name provides the filename recorded in _source_file.
+
+        workers > 1 fans the sheets out over a ProcessPoolExecutor (CPU-bound
+        parsing bypasses the GIL). Only possible for real paths - file-like
+        inputs and single-sheet files always run serially.
+
+        include_metadata=False skips the per-record _source_file/_source_sheet/
+        _extraction_timestamp tagging (smaller records and output).
         """
         warnings = []
         all_records = []
         sheets_processed = 0
-        
+
+        # Source identification (works for paths and file-like objects)
+        if isinstance(filepath, (str, Path)):
+            source_desc = str(filepath)
+            if source_name is None:
+                source_name = Path(filepath).name
+        else:
+            if source_name is None:
+                source_name = getattr(filepath, 'name', 'upload')
+            source_desc = source_name
+
         # Open file
         try:
-            excel_file = pd.ExcelFile(filepath)
+            excel_file = _open_excel(filepath)
+            # Previews are per-workbook; drop leftovers from earlier files
+            self.sheet_selector._preview_cache.clear()
         except Exception as e:
             return ExtractionResult(
                 success=False,
                 data=[],
                 message=f"Failed to open Excel file: {e}",
                 warnings=[str(e)],
-                metadata={'filepath': str(filepath)}
-            )
-        
-        # Determine which sheets to process
-        if process_all_sheets:
-            sheets_to_process = self.sheet_selector.get_all_data_sheets(excel_file)
-        else:
-            best_sheet = self.sheet_selector.select_best_sheet(excel_file)
-            sheets_to_process = [best_sheet] if best_sheet else []
-        
-        if not sheets_to_process:
-            return ExtractionResult(
-                success=False,
-                data=[],
-                message="No suitable sheets found in Excel file",
-                warnings=["Could not identify any rent roll sheets"],
-                metadata={'filepath': str(filepath), 'available_sheets': excel_file.sheet_names}
+                metadata={'filepath': source_desc}
             )
         
-        # Process each sheet
-        for sheet_name in sheets_to_process:
-            try:
-                # Read sheet
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-                
-                # Find header
-                header_result = self.header_detector.find_header_row(df)
-                if not header_result:
-                    warnings.append(f"Sheet '{sheet_name}': Could not detect header row")
-                    continue
-                
-                header_row, raw_headers = header_result
-                
-                # Handle multi-level headers
-                if header_row > 0:
-                    raw_headers = self.header_detector.handle_multi_level_headers(df, header_row)
-                
-                # Extract data
-                records = self.data_extractor.extract_data(df, header_row, raw_headers)
-                
-                # CRITICAL: Add source identification to each record
-                extraction_timestamp = datetime.now().isoformat()
+        try:
+            # Determine which sheets to process
+            if process_all_sheets:
+                sheets_to_process = self.sheet_selector.get_all_data_sheets(excel_file)
+            else:
+                best_sheet = self.sheet_selector.select_best_sheet(excel_file)
+                sheets_to_process = [best_sheet] if best_sheet else []
+
+            if not sheets_to_process:
+                return ExtractionResult(
+                    success=False,
+                    data=[],
+                    message="No suitable sheets found in Excel file",
+                    warnings=["Could not identify any rent roll sheets"],
+                    metadata={'filepath': source_desc, 'available_sheets': excel_file.sheet_names}
+                )
+
+            # Process each sheet - in parallel processes when requested and the
+            # input is a real path (workers re-open the workbook themselves)
+            use_processes = (workers > 1 and len(sheets_to_process) > 1
+                             and isinstance(filepath, (str, Path)))
+
+            sheet_results = []  # (sheet_name, records, warnings, raw_headers), in sheet order
+            if use_processes:
+                with ProcessPoolExecutor(max_workers=min(workers, len(sheets_to_process))) as pool:
+                    futures = {s: pool.submit(_process_sheet_task, str(filepath), s,
+                                              self.synonyms_file)
+                               for s in sheets_to_process}
+                    for sheet_name in sheets_to_process:
+                        try:
+                            sheet_results.append((sheet_name, *futures[sheet_name].result()))
+                        except Exception as e:
+                            warnings.append(f"Sheet '{sheet_name}': Error - {str(e)}")
+            else:
+                for sheet_name in sheets_to_process:
+                    try:
+                        sheet_results.append((sheet_name, *self._extract_sheet(excel_file, sheet_name)))
+                    except Exception as e:
+                        warnings.append(f"Sheet '{sheet_name}': Error - {str(e)}")
+            sheet_names_available = excel_file.sheet_names
+        finally:
+            # Release workbook state and the 30-row previews eagerly - the
+            # records are extracted, so nothing below needs the file anymore
+            self.sheet_selector._preview_cache.clear()
+            excel_file.close()
+
+        # pandas block managers are cycle-heavy; collect once per workbook so
+        # RSS tracks roughly one file instead of waiting for the GC threshold
+        gc.collect()
+
+        # One timestamp for the whole extraction run, not one per sheet
+        extraction_timestamp = datetime.now().isoformat()
+
+        collected_headers = []  # language-detection sample, capped at ~90
+        for sheet_name, records, sheet_warnings, raw_headers in sheet_results:
+            if len(collected_headers) < 90:
+                collected_headers.extend(raw_headers)
+            warnings.extend(sheet_warnings)
+            if not records and sheet_warnings:
+                continue
+
+            # CRITICAL: Add source identification to each record
+            if include_metadata:
                 for record in records:
-                    record['_source_file'] = filepath.name
+                    record['_source_file'] = source_name
                     record['_source_sheet'] = sheet_name
                     record['_extraction_timestamp'] = extraction_timestamp
-                
-                all_records.extend(records)
-                sheets_processed += 1
-                
-            except Exception as e:
-                warnings.append(f"Sheet '{sheet_name}': Error - {str(e)}")
-        
-        # Detect language
-        all_headers = []
-        for sheet in sheets_to_process[:3]:
-            try:
-                df = pd.read_excel(excel_file, sheet_name=sheet, nrows=30, header=None)
-                header_result = self.header_detector.find_header_row(df)
-                if header_result:
-                    all_headers.extend(header_result[1])
-            except:
-                pass
+
+            all_records.extend(records)
+            sheets_processed += 1
         
-        detected_lang = self.mapper.detect_language(all_headers)
+        # Detect language from the headers the sheet loop already found -
+        # no second pass over the sheets; ~90 headers (3 sheets) are plenty
+        detected_lang = self.mapper.detect_language(collected_headers)
 
         # After extracting all records, apply tenant and unit resolution.
         # This step harmonizes tenant_name/tenant_id and unit_id/asset_id fields
@@ -1124,9 +1471,9 @@ class RentRollExcelReader:
             message=f"Extracted {len(all_records)} records from {sheets_processed} sheet(s)",
             warnings=warnings,
             metadata={
-                'filepath': str(filepath),
+                'filepath': source_desc,
                 'sheets_processed': sheets_processed,
-                'sheets_available': excel_file.sheet_names,
+                'sheets_available': sheet_names_available,
                 'detected_language': detected_lang,
                 'total_rows': len(all_records)
             },
@@ -1135,6 +1482,18 @@ class RentRollExcelReader:
         )
 
 
+# Separator stripping for phone-number detection: one C pass via
+# str.translate instead of two re.sub calls per candidate
+_PHONE_STRIP = str.maketrans('', '', ' \t\n\r\x0b\x0c-')
+
+
+def _process_sheet_task(filepath: str, sheet_name: str,
+                        synonyms_file: Optional[Path]) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """Top-level (picklable) worker: extract one sheet in a separate process."""
+    reader = RentRollExcelReader(synonyms_file)
+    return reader._extract_sheet(_open_excel(filepath), sheet_name)
+
+
 # ============================================================================
 # VALIDATION
 # ============================================================================
@@ -1307,6 +1666,10 @@ def main():
                         help='Only process best sheet (default: all sheets)')
     parser.add_argument('--output', '-o', help='Output JSON file')
     parser.add_argument('--synonyms', help='Path to synonyms JSON file')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallele Prozesse für Multi-Sheet-Dateien (1 = seriell)')
+    parser.add_argument('--no-metadata', action='store_true',
+                        help='Keine _source_*-Felder pro Record schreiben')
     
     args = parser.parse_args()
     
@@ -1334,7 +1697,9 @@ def main():
     print(f"\n📄 Processing: {filepath.name}")
     print(f"   Mode: {'Single sheet' if args.single_sheet else 'All sheets'}")
     
-    result = reader.read_excel(filepath, process_all_sheets=not args.single_sheet)
+    result = reader.read_excel(filepath, process_all_sheets=not args.single_sheet,
+                               workers=args.workers,
+                               include_metadata=not args.no_metadata)
     
     # Print results
     print(f"\n{'✅' if result.success else '❌'} {result.message}")
@@ -1349,23 +1714,42 @@ def main():
     # Output
     if args.output:
         output_path = Path(args.output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'success': result.success,
-                'message': result.message,
-                'metadata': result.metadata,
-                'warnings': result.warnings,
-                'data': result.data
-            }, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_SUPPORT:
+            # C-level encoder, streamed record-by-record: no monolithic
+            # output string and no per-value default=str reflection in Python
+            with open(output_path, 'wb') as f:
+                envelope = orjson.dumps({
+                    'success': result.success,
+                    'message': result.message,
+                    'metadata': result.metadata,
+                    'warnings': result.warnings
+                }, default=str)
+                f.write(envelope[:-1])  # reopen the envelope for 'data'
+                f.write(b',"data":[')
+                for i, record in enumerate(result.data):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(record, default=str))
+                f.write(b']}')
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'success': result.success,
+                    'message': result.message,
+                    'metadata': result.metadata,
+                    'warnings': result.warnings,
+                    'data': result.data
+                }, f, indent=2, ensure_ascii=False, default=str)
         print(f"\n💾 Output saved to: {output_path}")
     else:
         # Print first 3 records as preview
         print("\n📊 Preview (first 3 records):")
+        public_keys = [k for k in result.data[0].keys() if not k.startswith('_')] if result.data else []
         for i, record in enumerate(result.data[:3]):
             print(f"\n   Record {i+1}:")
-            for key, value in record.items():
-                if not key.startswith('_'):
-                    print(f"      {key}: {value}")
+            for key in public_keys:
+                if key in record:
+                    print(f"      {key}: {record[key]}")
     
     # Validate
     validator = DataValidator()